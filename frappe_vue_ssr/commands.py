@@ -0,0 +1,23 @@
+import click
+
+import frappe
+from frappe.commands import get_site, pass_context
+
+
+@click.command("build-vue-ssg")
+@pass_context
+def build_vue_ssg(context):
+	"""Pre-render static .vue pages so requests can serve them from disk"""
+	site = get_site(context)
+	frappe.init(site=site)
+	frappe.connect()
+	try:
+		from frappe_vue_ssr.vue_renderer.ssg import prerender_all
+
+		count = prerender_all()
+		click.echo(f"Prerendered {count} Vue page(s)")
+	finally:
+		frappe.destroy()
+
+
+commands = [build_vue_ssg]
@@ -0,0 +1,311 @@
+import heapq
+import os
+import queue
+import selectors
+import struct
+import subprocess
+import threading
+import time
+
+import orjson
+
+import frappe
+from frappe.utils.logger import get_logger
+
+# Create logger for frappe_vue_ssr
+logger = get_logger("frappe_vue_ssr")
+
+# Default number of persistent Node.js workers per pool
+DEFAULT_POOL_SIZE = min(4, os.cpu_count() or 1)
+
+# One pool per (node command, app root) so each app renders from its own
+# project root (node_modules, vite config, postcss config etc.)
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class NodeWorkerError(Exception):
+    """Raised when a worker dies, times out or misbehaves mid-request"""
+    pass
+
+
+class _PendingRequest:
+    """A render request awaiting its reply frame"""
+
+    __slots__ = ("worker", "request_id", "deadline", "event", "response", "error")
+
+    def __init__(self, worker, request_id, deadline):
+        self.worker = worker
+        self.request_id = request_id
+        self.deadline = deadline
+        self.event = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class NodeWorker:
+    """
+    A single long-lived `node vue_ssr_renderer.js --server` process.
+
+    Requests and replies are JSON objects exchanged over the worker's
+    stdin/stdout pipes with 4-byte big-endian length-prefixed framing.
+    Replies are consumed by the pool's shared reader thread.
+    """
+
+    def __init__(self, node_cmd, renderer_path, cwd):
+        self.node_cmd = node_cmd
+        self.renderer_path = renderer_path
+        self.cwd = cwd
+        self.process = None
+        self.buffer = b""
+        self._request_id = 0
+        self.start()
+
+    def start(self):
+        self.buffer = b""
+        self.process = subprocess.Popen(
+            [self.node_cmd, self.renderer_path, "--server"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            # stderr is inherited so renderer diagnostics still reach the logs
+            cwd=self.cwd,
+        )
+        logger.info(f"Started Vue SSR worker (pid {self.process.pid}) in {self.cwd}")
+
+    def kill(self):
+        if self.process:
+            try:
+                self.process.kill()
+                self.process.wait(timeout=5)
+            except Exception:
+                pass
+
+    def is_alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def next_request_id(self):
+        self._request_id += 1
+        return self._request_id
+
+    def write_request(self, request_id, vue_file_path, server_data_bytes):
+        """
+        Frame and send one render request. server_data_bytes is
+        pre-serialized JSON, spliced in without re-encoding.
+        """
+        frame = b'{"id":%d,"vueFile":%s,"serverData":%s}' % (
+            request_id,
+            orjson.dumps(vue_file_path),
+            server_data_bytes,
+        )
+        self.process.stdin.write(struct.pack(">I", len(frame)) + frame)
+        self.process.stdin.flush()
+
+    def pop_frames(self):
+        """
+        Yield every complete reply frame currently in the read buffer
+        """
+        while len(self.buffer) >= 4:
+            (length,) = struct.unpack(">I", self.buffer[:4])
+            if len(self.buffer) < 4 + length:
+                break
+            frame = self.buffer[4:4 + length]
+            self.buffer = self.buffer[4 + length:]
+            yield orjson.loads(frame)
+
+
+class NodeWorkerPool:
+    """
+    Pool of persistent Node.js SSR workers. Request threads block on a
+    per-request Event; a single reader thread multiplexes every worker's
+    stdout through a selector and enforces per-job deadlines from a heap,
+    so N in-flight renders cost one waiting thread instead of N timers.
+    """
+
+    def __init__(self, node_cmd, renderer_path, cwd, size=None):
+        self.node_cmd = node_cmd
+        self.renderer_path = renderer_path
+        self.cwd = cwd
+        self.size = size or frappe.conf.get("vue_ssr_pool_size") or DEFAULT_POOL_SIZE
+
+        self._lock = threading.Lock()
+        self._pending = {}          # (worker, request_id) -> _PendingRequest
+        self._deadlines = []        # heap of (deadline, worker, request_id)
+        self._selector = selectors.DefaultSelector()
+
+        # Self-pipe so render() can wake the reader when a new request
+        # introduces an earlier deadline than the current select timeout
+        self._wake_read, self._wake_write = os.pipe()
+        self._selector.register(self._wake_read, selectors.EVENT_READ, data=None)
+
+        self.workers = []
+        self.idle = queue.Queue()
+        for _ in range(self.size):
+            worker = NodeWorker(node_cmd, renderer_path, cwd)
+            self.workers.append(worker)
+            self._selector.register(worker.process.stdout, selectors.EVENT_READ, data=worker)
+            self.idle.put(worker)
+
+        self._reader = threading.Thread(target=self._read_loop, daemon=True, name="vue-ssr-pool-reader")
+        self._reader.start()
+
+    def render(self, vue_file_path, server_data_bytes, timeout=30):
+        """
+        Render a Vue component on the next idle worker and return the
+        parsed response dict from the Node renderer
+        """
+        try:
+            worker = self.idle.get(timeout=timeout)
+        except queue.Empty:
+            # A saturated pool is a normal overload condition - name it
+            # instead of letting a bare queue.Empty escape
+            raise NodeWorkerError(
+                f"No idle Vue SSR worker within {timeout} seconds (pool size {self.size})"
+            )
+
+        try:
+            pending = self._submit(worker, vue_file_path, server_data_bytes, timeout)
+
+            # The reader thread enforces the deadline; the extra slack
+            # only guards against the reader itself dying
+            pending.event.wait(timeout + 5)
+
+            if pending.error:
+                raise pending.error
+            if pending.response is None:
+                raise NodeWorkerError(f"Vue SSR worker gave no reply within {timeout} seconds")
+            return pending.response
+        finally:
+            self.idle.put(worker)
+
+    def _submit(self, worker, vue_file_path, server_data_bytes, timeout):
+        # Only the pending-map/heap mutation happens under the lock. The
+        # pipe write can block on a full buffer against a wedged worker
+        # and must not hold the lock the reader thread needs to keep
+        # draining (and timing out) every other worker.
+        with self._lock:
+            if not worker.is_alive():
+                self._replace_worker(worker, NodeWorkerError("Vue SSR worker died"))
+
+            request_id = worker.next_request_id()
+            pending = _PendingRequest(worker, request_id, time.monotonic() + timeout)
+            self._pending[(worker, request_id)] = pending
+            # id(worker)/request_id keep heap tuples comparable
+            heapq.heappush(self._deadlines, (pending.deadline, id(worker), request_id, worker))
+
+        # Wake the reader first so the deadline is armed even if the
+        # write below blocks - expiry then kills the wedged worker,
+        # which also unblocks the write
+        os.write(self._wake_write, b"x")
+
+        try:
+            worker.write_request(request_id, vue_file_path, server_data_bytes)
+        except (BrokenPipeError, OSError) as e:
+            with self._lock:
+                self._replace_worker(worker, NodeWorkerError(f"Vue SSR worker pipe broken: {e}"))
+            raise NodeWorkerError(f"Vue SSR worker pipe broken: {e}")
+
+        return pending
+
+    def _read_loop(self):
+        while True:
+            timeout = None
+            with self._lock:
+                if self._deadlines:
+                    timeout = max(0, self._deadlines[0][0] - time.monotonic())
+
+            for key, _ in self._selector.select(timeout):
+                if key.data is None:
+                    os.read(self._wake_read, 4096)
+                else:
+                    self._drain_worker(key.data, key.fileobj)
+
+            self._expire_deadlines()
+
+    def _drain_worker(self, worker, stdout):
+        """
+        Read whatever the selected pipe has buffered. The selected fd can
+        belong to a process that _submit already replaced between select()
+        returning and this read - reading the successor's empty pipe
+        instead would block the pool's only reader thread, so act only on
+        the fd that was actually selected and re-check it is still the
+        worker's current stdout before mutating any state.
+        """
+        with self._lock:
+            if worker.process is None or worker.process.stdout is not stdout:
+                return
+
+        try:
+            chunk = os.read(stdout.fileno(), 65536)
+        except OSError:
+            chunk = b""
+
+        with self._lock:
+            if worker.process is None or worker.process.stdout is not stdout:
+                # Replaced while we were reading - the chunk (or EOF)
+                # belongs to the dead predecessor, not the new process
+                return
+
+            if not chunk:
+                self._replace_worker(worker, NodeWorkerError("Vue SSR worker closed its stdout (worker died)"))
+                return
+
+            worker.buffer += chunk
+            for response in worker.pop_frames():
+                pending = self._pending.pop((worker, response.get("id")), None)
+                if pending:
+                    pending.response = response
+                    pending.event.set()
+
+    def _expire_deadlines(self):
+        with self._lock:
+            now = time.monotonic()
+            while self._deadlines and self._deadlines[0][0] <= now:
+                _, _, request_id, worker = heapq.heappop(self._deadlines)
+                if (worker, request_id) in self._pending:
+                    # Kill the stuck render along with its worker
+                    timeout_error = NodeWorkerError("Vue SSR worker timed out")
+                    self._replace_worker(worker, timeout_error)
+
+    def _replace_worker(self, worker, error):
+        """
+        Fail every pending request on this worker with `error`, then
+        respawn its process and re-register the new stdout. Caller holds
+        self._lock.
+        """
+        for key in [key for key in self._pending if key[0] is worker]:
+            pending = self._pending.pop(key)
+            pending.error = error
+            pending.event.set()
+
+        try:
+            self._selector.unregister(worker.process.stdout)
+        except (KeyError, ValueError):
+            pass
+
+        worker.kill()
+        worker.start()
+        self._selector.register(worker.process.stdout, selectors.EVENT_READ, data=worker)
+
+    def shutdown(self):
+        for worker in self.workers:
+            if worker.process:
+                try:
+                    worker.process.terminate()
+                except Exception:
+                    pass
+
+
+def get_worker_pool(node_cmd, renderer_path, cwd):
+    """
+    Return the shared worker pool for this (node command, app root),
+    creating it on first use
+    """
+    key = (node_cmd, cwd)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = NodeWorkerPool(node_cmd, renderer_path, cwd)
+                _pools[key] = pool
+    return pool
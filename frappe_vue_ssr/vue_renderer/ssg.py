@@ -0,0 +1,73 @@
+import os
+import re
+
+import frappe
+from frappe.utils.logger import get_logger
+
+from frappe_vue_ssr.vue_renderer.vue_renderer import VueRenderer, get_route_index
+
+# Create logger for frappe_vue_ssr
+logger = get_logger("frappe_vue_ssr")
+
+# Pages that declare `ssg: false` in their script block opt out of
+# prerendering (e.g. pages whose output depends on the session user)
+SSG_OPT_OUT = re.compile(r"\bssg\s*:\s*false\b")
+
+
+def neutral_server_data():
+    """
+    Server data for build-time renders - no session-specific values, so
+    the output is valid for every visitor
+    """
+    return {
+        "serverTime": frappe.utils.now(),
+        "user": "Guest",
+        "siteName": frappe.local.site or "localhost",
+    }
+
+
+def prerender_all():
+    """
+    Pre-render every SSG-eligible .vue page to
+    <app>/public/ssr/prerendered/<route>.html and return the count
+    """
+    count = 0
+    for route in sorted(get_route_index()):
+        if prerender_route(route):
+            count += 1
+    return count
+
+
+def prerender_route(route):
+    """
+    Pre-render a single route; returns True if a file was written
+    """
+    renderer = VueRenderer(route)
+    if not renderer.can_render():
+        return False
+
+    if SSG_OPT_OUT.search(renderer.vue_component_content):
+        logger.info(f"Skipping SSG for {route} (declares ssg: false)")
+        return False
+
+    renderer.init_context()
+    renderer.update_context()
+    renderer.post_process_context()
+
+    # Always render fresh at build time
+    renderer.context.no_ssr_cache = True
+    html = renderer.render_vue_with_nodejs(server_data=neutral_server_data())
+
+    if renderer.ssr_failed:
+        # Never persist the fallback error page - get_prerendered_html
+        # would serve it to every visitor until the next successful build
+        logger.error(f"Prerender failed for {route}, skipping")
+        return False
+
+    prerendered_path = renderer.get_prerendered_path()
+    os.makedirs(os.path.dirname(prerendered_path), exist_ok=True)
+    with open(prerendered_path, 'wb') as f:
+        f.write(html)
+
+    logger.info(f"Prerendered {route} -> {prerendered_path}")
+    return True
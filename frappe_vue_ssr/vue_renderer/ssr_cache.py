@@ -0,0 +1,144 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import frappe
+from frappe.utils.logger import get_logger
+
+# Create logger for frappe_vue_ssr
+logger = get_logger("frappe_vue_ssr")
+
+# Default max L1 (in-process) entries - Redis provides the bulk capacity
+DEFAULT_L1_SIZE = 256
+
+# Prefix for the individual L2 keys shared by all workers - one Redis
+# key per entry so each carries its own TTL and Redis evicts per entry,
+# instead of one hash that can only expire (and grow) wholesale
+L2_KEY_PREFIX = "vue_ssr|"
+
+# Default seconds before an L2 entry expires
+DEFAULT_TTL = 3600
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+class LRUCache:
+    """
+    Minimal thread-safe LRU cache for rendered SSR responses.
+    Keys are (vue_file_path, mtime_ns, server_data_digest) tuples, so
+    entries invalidate automatically when the .vue file changes on disk.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class SSRCache:
+    """
+    Two-tier cache for rendered SSR responses: a small in-process LRU
+    for zero-copy hits, backed by per-entry Redis keys (frappe.cache())
+    shared by every gunicorn worker - so N workers share warm entries
+    instead of each rendering its own copy, caches survive worker
+    restarts, and Redis expires each entry on its own TTL.
+    """
+
+    def __init__(self, l1_size, ttl):
+        self.l1 = LRUCache(l1_size)
+        self.ttl = ttl
+
+    def get(self, key):
+        response = self.l1.get(key)
+        if response is not None:
+            return response
+
+        l2_key = self._l2_key(key)
+        try:
+            entry = frappe.cache().get_value(l2_key, expires=True)
+        except Exception:
+            logger.warning("Vue SSR shared cache read failed", exc_info=True)
+            return None
+
+        if not entry:
+            return None
+
+        # Stale if the .vue file changed since this entry was stored
+        if entry.get("mtime_ns") != key[1]:
+            try:
+                frappe.cache().delete_value(l2_key)
+            except Exception:
+                pass
+            return None
+
+        response = entry.get("response")
+        if response is not None:
+            # Promote so the next hit in this process skips Redis
+            self.l1.set(key, response)
+        return response
+
+    def set(self, key, response):
+        self.l1.set(key, response)
+        try:
+            frappe.cache().set_value(
+                self._l2_key(key),
+                {"mtime_ns": key[1], "response": response},
+                expires_in_sec=self.ttl,
+            )
+        except Exception:
+            logger.warning("Vue SSR shared cache write failed", exc_info=True)
+
+    def clear(self):
+        self.l1.clear()
+        try:
+            frappe.cache().delete_keys(L2_KEY_PREFIX)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _l2_key(key):
+        """
+        Redis key for a cache entry: hex digest over the .vue path and
+        the server-data digest (mtime is validated, not keyed, so a
+        rebuilt file replaces its entry instead of leaking a new one)
+        """
+        vue_file_path, _mtime_ns, data_digest = key
+        return L2_KEY_PREFIX + hashlib.blake2b(
+            vue_file_path.encode('utf-8') + data_digest, digest_size=16
+        ).hexdigest()
+
+
+def get_ssr_cache():
+    """
+    Return the shared SSR cache, creating it on first use. L1 size and
+    TTL are configurable with the vue_ssr_cache_size and
+    vue_ssr_cache_ttl site config keys.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SSRCache(
+                    l1_size=frappe.conf.get("vue_ssr_cache_size") or DEFAULT_L1_SIZE,
+                    ttl=frappe.conf.get("vue_ssr_cache_ttl") or DEFAULT_TTL,
+                )
+    return _cache
@@ -1,14 +1,192 @@
+import hashlib
 import os
-import json
+import shutil
 import subprocess
+import threading
+import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property
+
+import orjson
+
 import frappe
+from werkzeug.wrappers import Response
 from frappe.website.page_renderers.base_template_page import BaseTemplatePage
 from frappe.utils.logger import get_logger
 
+from frappe_vue_ssr.vue_renderer.node_worker_pool import NodeWorkerError, get_worker_pool
+from frappe_vue_ssr.vue_renderer.ssr_cache import get_ssr_cache
+
 # Create logger for frappe_vue_ssr
 logger = get_logger("frappe_vue_ssr")
 
+# Server-data keys that change on every request and must stay out of the
+# SSR cache key - digesting them would make every key unique and turn the
+# cache into a write-only store
+VOLATILE_SERVER_DATA_KEYS = ("serverTime",)
+
+# Resolved Node.js command, memoized for the life of the process - the
+# version probes exec up to 7 subprocesses and the answer never changes
+_NODE_CMD_CACHE = None
+_NODE_CMD_LOCK = threading.Lock()
+
+# Page skeletons pre-encoded to UTF-8 once at import - per request we
+# only %-substitute the dynamic slots (bytes formatting, PEP 461), so the
+# response body stays bytes all the way to build_response with no final
+# encode pass. Literal % signs are doubled for the formatter.
+_PAGE_TEMPLATE = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>%(title)s</title>
+            <meta charset="utf-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1">
+            <!-- Vue is bundled in the client JavaScript, no CDN needed -->
+            <style>
+                body {
+                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+                    margin: 0;
+                    padding: 20px;
+                    line-height: 1.6;
+                }
+                .vue-ssr-rendered {
+                    color: #2c3e50;
+                }
+                .server-rendered {
+                    background: linear-gradient(135deg, #667eea 0%%, #764ba2 100%%);
+                    color: white;
+                    padding: 12px 20px;
+                    border-radius: 8px;
+                    margin-bottom: 20px;
+                    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+                }
+                .server-rendered small {
+                    display: flex;
+                    align-items: center;
+                    gap: 8px;
+                }
+
+                /* Vue Component Styles */
+                %(styles)s
+            </style>
+        </head>
+        <body>
+            <div class="server-rendered">
+                <small>
+                    🔥 Server-side rendered with Python + Node.js + Vue SSR (Self-contained Bundle)
+                    <span style="opacity: 0.8;">(%(now)s)</span>
+                </small>
+            </div>
+            <div id="app" class="vue-ssr-rendered">%(rendered_html)s</div>
+
+            <script>
+                // Inject server data for hydration
+                %(server_data_script)s
+            </script>
+
+            %(client_script_tag)s
+
+            <script>
+                console.log('🚀 Vue app hydrated with self-contained bundle!');
+            </script>
+        </body>
+        </html>
+        """.encode("utf-8")
+
+_FALLBACK_TEMPLATE = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Vue SSR Error</title>
+            <meta charset="utf-8">
+            <style>
+                body { font-family: Arial, sans-serif; margin: 40px; }
+                .error {
+                    background: #fee;
+                    border: 1px solid #f88;
+                    padding: 20px;
+                    border-radius: 4px;
+                    color: #c33;
+                }
+                .fallback {
+                    background: #fff3cd;
+                    border: 1px solid #ffeaa7;
+                    padding: 15px;
+                    border-radius: 4px;
+                    margin-top: 20px;
+                }
+            </style>
+        </head>
+        <body>
+            <div class="error">
+                %(html)s
+            </div>
+            <div class="fallback">
+                <p><strong>Note:</strong> This is a fallback view. The Vue component could not be server-rendered.</p>
+                <p>Vue file: <code>%(vue_file_path)s</code></p>
+            </div>
+        </body>
+        </html>
+        """.encode("utf-8")
+
+# Client bundle paths already validated, mapped to the monotonic time
+# after which they get re-stat'ed - inside the window requests skip the
+# stat entirely. Bundles only change at deploy, so trusting a check for
+# a minute just means a deleted bundle is noticed one window late.
+_STATIC_OK = {}
+STATIC_REVALIDATE_SECONDS = 60
+
+# Route -> (app, app_path, vue_file_path, mtime_ns) for every .vue page,
+# so route resolution is a dict lookup instead of one stat per installed
+# app, and the mtime recorded at index time serves cache validation
+_ROUTE_INDEX = None
+_ROUTE_INDEX_LOCK = threading.Lock()
+
+
+def _scan_www_dir(www_path, app, app_path, index, prefix=""):
+    """
+    Record every .vue file under www_path into index, one scandir
+    (single getdents-backed syscall batch) per directory
+    """
+    try:
+        entries = os.scandir(www_path)
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _scan_www_dir(entry.path, app, app_path, index, prefix + entry.name + "/")
+            elif entry.name.endswith(".vue"):
+                route = prefix + entry.name[:-len(".vue")]
+                try:
+                    mtime_ns = entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+                index[route] = (app, app_path, entry.path, mtime_ns)
+
+
+def get_route_index():
+    """
+    Return the route index, building it on first use. Later-installed
+    apps override earlier ones, matching the old per-request search
+    through reversed(get_installed_apps()). Rebuilt per request in
+    developer mode so new pages show up without a restart.
+    """
+    global _ROUTE_INDEX
+    if _ROUTE_INDEX is not None and not frappe.conf.get("developer_mode"):
+        return _ROUTE_INDEX
+
+    with _ROUTE_INDEX_LOCK:
+        index = {}
+        for app in frappe.get_installed_apps():
+            app_path = frappe.get_app_path(app)
+            _scan_www_dir(os.path.join(app_path, "www"), app, app_path, index)
+        _ROUTE_INDEX = index
+
+    return _ROUTE_INDEX
+
 class VueRenderer(BaseTemplatePage):
     def __init__(self, path, http_status_code=None):
         super().__init__(path=path, http_status_code=http_status_code)
@@ -16,48 +194,110 @@ class VueRenderer(BaseTemplatePage):
 
     def set_vue_template_path(self):
         """
-        Searches for .vue files matching the path in the /www folders
+        Looks up the path in the precomputed .vue route index
         """
         self.vue_file_path = None
-        self.vue_component_content = None
 
-        # Search through all installed apps
-        for app in reversed(frappe.get_installed_apps()):
-            app_path = frappe.get_app_path(app)
-
-            # Look in the www directory for a .vue file
-            vue_file_path = os.path.join(app_path, "www", self.path + ".vue")
+        entry = get_route_index().get(self.path)
+        if not entry:
+            return
 
-            if os.path.isfile(vue_file_path):
-                self.app = app
-                self.app_path = app_path
-                self.vue_file_path = vue_file_path
-                self.template_path = os.path.relpath(vue_file_path, app_path)
-                self.basepath = os.path.dirname(vue_file_path)
-                self.filename = os.path.basename(vue_file_path)
-                self.name = os.path.splitext(self.filename)[0]
+        app, app_path, vue_file_path, vue_mtime_ns = entry
+        self.app = app
+        self.app_path = app_path
+        self.vue_file_path = vue_file_path
+        self.vue_mtime_ns = vue_mtime_ns
+        self.template_path = os.path.relpath(vue_file_path, app_path)
+        self.basepath = os.path.dirname(vue_file_path)
+        self.filename = os.path.basename(vue_file_path)
+        self.name = os.path.splitext(self.filename)[0]
 
-                logger.info(f"Found Vue file: {vue_file_path} in app: {app}")
+        logger.info("Found Vue file: %s in app: %s", vue_file_path, app)
 
-                # Read the Vue component content
-                with open(vue_file_path, 'r', encoding='utf-8') as f:
-                    self.vue_component_content = f.read()
+    @cached_property
+    def request_time(self):
+        """
+        Timestamp for this render, computed once and shared between the
+        server data and the page shell instead of two now() round-trips
+        """
+        return frappe.utils.now()
 
-                return
+    @cached_property
+    def vue_component_content(self):
+        """
+        Source of the .vue file, read lazily on first access - the Node
+        renderer reads the file itself, so most requests never need this
+        """
+        with open(self.vue_file_path, 'r', encoding='utf-8') as f:
+            return f.read()
 
     def can_render(self):
         """
-        Return True if we found a .vue file for this path
+        Return True if we found a .vue file for this path - the route
+        index already verified existence, so no extra stat here
         """
-        return self.vue_file_path is not None and os.path.isfile(self.vue_file_path)
+        return self.vue_file_path is not None
 
     def render(self):
         """
         Render the Vue component to HTML using Node.js Vue SSR
         """
-        html = self.get_html()
+        html = self.get_prerendered_html() or self.get_html()
         html = self.add_csrf_token(html)
-        return self.build_response(html)
+
+        # Conditional GET: a repeat visitor whose copy still matches gets
+        # a 304 and ~200 bytes of headers instead of the full document
+        etag = hashlib.blake2b(html, digest_size=16).hexdigest()
+        request = getattr(frappe.local, 'request', None)
+        if request and request.if_none_match.contains(etag):
+            not_modified = Response(status=304)
+            not_modified.set_etag(etag)
+            return not_modified
+
+        response = self.build_response(html)
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'private, must-revalidate'
+        return response
+
+    def get_prerendered_path(self):
+        """
+        Where `bench build-vue-ssg` writes this page's prerendered HTML
+        """
+        return os.path.join(self.app_path, 'public', 'ssr', 'prerendered', self.path + '.html')
+
+    def get_prerendered_html(self):
+        """
+        Return build-time prerendered HTML if it exists and is at least
+        as new as the .vue source, else None. A hit skips the whole SSR
+        pipeline - no Node, no JSON, just one file read.
+        """
+        prerendered_path = self.get_prerendered_path()
+        try:
+            prerendered_mtime = os.stat(prerendered_path).st_mtime_ns
+        except OSError:
+            return None
+
+        if prerendered_mtime < self.vue_mtime_ns:
+            # .vue file changed since the last SSG build - treat as stale
+            return None
+
+        logger.debug("Serving prerendered HTML for %s", self.path)
+        with open(prerendered_path, 'rb') as f:
+            return f.read()
+
+    def add_csrf_token(self, html):
+        """
+        Bytes-aware version of BaseTemplatePage.add_csrf_token - the
+        render pipeline carries the page as bytes end to end, so the
+        CSRF script is spliced in without decoding the document
+        """
+        if frappe.local.session:
+            csrf_script = (
+                f'<script>frappe.csrf_token = "{frappe.local.session.data.csrf_token}";</script>'
+            ).encode('utf-8')
+            return html.replace(b'<!-- csrf_token -->', csrf_script)
+
+        return html
 
     def get_html(self):
         """
@@ -74,28 +314,78 @@ class VueRenderer(BaseTemplatePage):
 
     def get_compatible_node_command(self):
         """
-        Find Node.js v22+
+        Find Node.js v22+, memoized at module scope after the first
+        successful resolution so steady-state requests skip the probes
+        """
+        global _NODE_CMD_CACHE
+        if _NODE_CMD_CACHE:
+            return _NODE_CMD_CACHE
+
+        with _NODE_CMD_LOCK:
+            if _NODE_CMD_CACHE:
+                return _NODE_CMD_CACHE
+
+            # Reuse a previous resolution across worker restarts; admins can
+            # clear with frappe.cache().delete_value('vue_ssr_node_cmd')
+            # after upgrading Node
+            cached_cmd = frappe.cache().get_value('vue_ssr_node_cmd')
+            if cached_cmd:
+                _NODE_CMD_CACHE = cached_cmd
+                return cached_cmd
+
+            node_cmd = self._probe_node_command()
+            _NODE_CMD_CACHE = node_cmd
+            frappe.cache().set_value('vue_ssr_node_cmd', node_cmd)
+            return node_cmd
+
+    def _probe_node_command(self):
+        """
+        Probe the system for a compatible Node.js v22+ binary
         """
-        # Try different Node.js commands in order of preference
-        # Include common paths for Node.js v22 installations
-        node_commands = [
-            "node22",                                    # Direct v22 command
-            "/opt/homebrew/bin/node22",                  # Homebrew v22 on Apple Silicon
-            "/usr/local/bin/node22",                     # Homebrew v22 on Intel Mac
-            "/opt/homebrew/bin/node",                    # Homebrew default on Apple Silicon
-            "/usr/local/bin/node",                       # Homebrew default on Intel Mac
-            "node",                                      # System default
-            "/usr/bin/node",                             # System installation
-        ]
+        # Resolve candidate binaries with PATH scans (shutil.which) instead
+        # of exec'ing 7 hard-coded path guesses - only resolved, distinct
+        # binaries get a --version probe. The extra directories cover
+        # Homebrew and system installs that may not be on the server PATH.
+        search_path = os.pathsep.join([
+            os.environ.get("PATH", os.defpath),
+            "/opt/homebrew/bin",    # Homebrew on Apple Silicon
+            "/usr/local/bin",       # Homebrew on Intel Mac
+            "/usr/bin",             # System installation
+        ])
+
+        node_commands = []
+        for name in ("node22", "node"):
+            resolved = shutil.which(name, path=search_path)
+            if resolved and resolved not in node_commands:
+                node_commands.append(resolved)
 
         v22_nodes = []
         other_nodes = []
 
+        # Probe all candidates concurrently - each probe can block for up
+        # to 5 seconds, so a cold start pays max(probe) instead of the sum
+        results = {}
+        if node_commands:
+            with ThreadPoolExecutor(max_workers=len(node_commands)) as executor:
+                futures = {
+                    executor.submit(
+                        subprocess.run, [cmd, "--version"],
+                        capture_output=True, text=True, timeout=5,
+                    ): cmd
+                    for cmd in node_commands
+                }
+                for future in as_completed(futures):
+                    try:
+                        results[futures[future]] = future.result()
+                    except (subprocess.SubprocessError, OSError):
+                        continue
+
+        # Classify in candidate order so equal versions keep the
+        # original command preference
         for cmd in node_commands:
             try:
-                # Check if the command exists and get version
-                result = subprocess.run([cmd, "--version"], capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
+                result = results.get(cmd)
+                if result and result.returncode == 0:
                     version = result.stdout.strip()
                     print(f"Found Node.js: {cmd} -> {version}")
                     logger.debug(f"Found Node.js: {cmd} -> {version}")
@@ -111,7 +401,7 @@ class VueRenderer(BaseTemplatePage):
                             other_nodes.append((cmd, major_version, version))
                             logger.debug(f"Node.js v{major_version} found but below v22 requirement: {cmd}")
 
-            except (subprocess.SubprocessError, ValueError, FileNotFoundError):
+            except ValueError:
                 continue
 
         # Only use Node.js v22+ - it's a hard requirement
@@ -145,11 +435,15 @@ After installation, you may need to restart your Frappe server.
         frappe.throw(error_msg, title="Node.js v22+ Required")
         return None  # This won't be reached due to frappe.throw
 
-    def render_vue_with_nodejs(self):
+    def render_vue_with_nodejs(self, server_data=None):
         """
-        Use Node.js with official Vue SSR packages to render the component
+        Use Node.js with official Vue SSR packages to render the component.
+        Callers (e.g. the SSG build) can pass explicit server_data instead
+        of the per-request default, and can check self.ssr_failed to tell
+        a fallback error page from real output.
         """
-        logger.info(f"Starting Vue SSR rendering for {self.vue_file_path}")
+        logger.info("Starting Vue SSR rendering for %s", self.vue_file_path)
+        self.ssr_failed = False
 
         try:
             # Get the path to our Node.js SSR renderer (in the root directory of the app)
@@ -161,42 +455,47 @@ After installation, you may need to restart your Frappe server.
                 logger.error(f"Node.js Vue SSR renderer not found at {renderer_path}")
                 return self._fallback_html(f"Node.js Vue SSR renderer not found at {renderer_path}")
 
-            # Prepare server data to pass to Vue component
-            server_data = self.prepare_server_data()
+            # Prepare server data to pass to Vue component. Sorted keys
+            # make structurally equal dicts serialize (and hash)
+            # identically; the canonical bytes are spliced straight into
+            # the worker frame.
+            if server_data is None:
+                server_data = self.prepare_server_data()
+            server_data_bytes = orjson.dumps(server_data, option=orjson.OPT_SORT_KEYS)
+
+            # Check the in-process cache first - a hit skips the Node
+            # round-trip entirely. Pages can opt out by setting
+            # context.no_ssr_cache; entries invalidate on .vue mtime change.
+            cache_key = None
+            if not self.context.get('no_ssr_cache'):
+                cache_key = self.get_ssr_cache_key(server_data)
+                response = get_ssr_cache().get(cache_key)
+                if response:
+                    logger.debug("Vue SSR cache hit for %s", self.vue_file_path)
+                    return self.build_complete_html(
+                        response.get('html', ''),
+                        response.get('styles', ''),
+                        response.get('clientBundleUrl', ''),
+                        response.get('serverDataScript', ''),
+                        rendered_at=response.get('renderedAt'),
+                    )
+
+                # Miss path: one fresh stat so an edited file is stored
+                # under its current mtime even if the index is stale
+                current_mtime_ns = os.stat(self.vue_file_path).st_mtime_ns
+                if current_mtime_ns != self.vue_mtime_ns:
+                    self.vue_mtime_ns = current_mtime_ns
+                    cache_key = self.get_ssr_cache_key(server_data)
 
             # Get compatible Node.js command
             node_cmd = self.get_compatible_node_command()
 
-            # Call Node.js renderer
-            cmd = [node_cmd, renderer_path, self.vue_file_path, json.dumps(server_data)]
+            # Render on a persistent Node.js worker instead of spawning a
+            # fresh process (and paying V8 startup) per request
+            logger.debug("Working directory: %s", app_root)
 
-            # Debug output
-            logger.debug(f"Working directory: {app_root}")
-            logger.debug(f"Vue SSR Command: {' '.join(cmd)}")
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,  # 30 second timeout
-                cwd=app_root  # Run from the app root directory
-            )
-
-            if result.returncode != 0:
-                error_msg = result.stderr or "Node.js renderer failed"
-                logger.error(f"Vue SSR subprocess failed with return code {result.returncode}: {error_msg}")
-                frappe.log_error(f"Vue SSR Error: {error_msg}", "Vue Renderer")
-                return self._fallback_html(f"Vue SSR Error: {error_msg}")
-
-            # Parse the JSON response from Node.js
-            try:
-                response = json.loads(result.stdout)
-            except json.JSONDecodeError as e:
-                logger.error(f"Vue SSR JSON Parse Error: {str(e)}")
-                logger.error(f"Raw stdout was: {result.stdout}")
-                frappe.log_error(f"Vue SSR JSON Parse Error: {str(e)}", "Vue Renderer")
-                frappe.log_error(f"Raw stdout was: {result.stdout}", "Vue Renderer")
-                return self._fallback_html(f"Invalid JSON response from Vue SSR: {str(e)}")
+            pool = get_worker_pool(node_cmd, renderer_path, app_root)
+            response = pool.render(self.vue_file_path, server_data_bytes, timeout=30)
 
             if not response.get('success'):
                 error_msg = response.get('error', 'Unknown error')
@@ -204,27 +503,54 @@ After installation, you may need to restart your Frappe server.
                 logger.error(f"Vue SSR renderer reported failure: {error_msg}")
                 return self._fallback_html(html)
 
-            logger.info(f"Vue SSR rendering completed successfully for {self.vue_file_path}")
+            logger.info("Vue SSR rendering completed successfully for %s", self.vue_file_path)
+
+            # Stamp the render time on the response so cache hits rebuild
+            # byte-identical pages (stable ETags) instead of re-dating them
+            response['renderedAt'] = self.request_time
 
-            logger.info(response.get('html'))
+            if cache_key:
+                get_ssr_cache().set(cache_key, response)
 
             # Build the complete HTML response
             return self.build_complete_html(
                 response.get('html', ''),
                 response.get('styles', ''),
                 response.get('clientBundleUrl', ''),
-                response.get('serverDataScript', '')
+                response.get('serverDataScript', ''),
+                rendered_at=response.get('renderedAt'),
             )
 
-        except subprocess.TimeoutExpired:
-            logger.error("Vue SSR renderer timed out after 30 seconds")
-            frappe.log_error("Vue SSR renderer timed out after 30 seconds", "Vue Renderer")
-            return self._fallback_html("Vue SSR renderer timed out")
+        except NodeWorkerError as e:
+            logger.error(f"Vue SSR worker error: {str(e)}")
+            frappe.log_error(f"Vue SSR worker error: {str(e)}", "Vue Renderer")
+            return self._fallback_html(f"Vue SSR worker error: {str(e)}")
         except Exception as e:
             logger.error(f"Vue SSR Exception: {str(e)}")
             frappe.log_error(f"Vue SSR Exception: {str(e)}", "Vue Renderer")
             return self._fallback_html(f"Vue SSR Exception: {str(e)}")
 
+    def get_ssr_cache_key(self, server_data):
+        """
+        Cache key for a rendered response: the .vue path, its mtime as
+        recorded in the route index (so edits invalidate stale entries
+        without a stat on the hit path) and a digest of the canonical,
+        non-volatile server data. Per-request values like serverTime are
+        excluded from the digest - otherwise every request gets a unique
+        key and the cache never hits.
+        """
+        stable_data = {
+            k: v for k, v in server_data.items()
+            if k not in VOLATILE_SERVER_DATA_KEYS
+        }
+        return (
+            self.vue_file_path,
+            self.vue_mtime_ns,
+            hashlib.blake2b(
+                orjson.dumps(stable_data, option=orjson.OPT_SORT_KEYS), digest_size=16
+            ).digest(),
+        )
+
     def prepare_server_data(self):
         """
         Prepare data to pass to the Vue component for server-side rendering
@@ -233,118 +559,39 @@ After installation, you may need to restart your Frappe server.
         # For example, user data, API responses, etc.
         server_data = {
             # Add any server-side data that should be available to the Vue component
-            "serverTime": frappe.utils.now(),
+            "serverTime": self.request_time,
             "user": frappe.session.user,
             "siteName": frappe.local.site or "localhost"
         }
 
         return server_data
 
-    def build_complete_html(self, rendered_html, styles, client_bundle_url, server_data_script):
-        """
-        Build the complete HTML page with Vue SSR content
+    def build_complete_html(self, rendered_html, styles, client_bundle_url, server_data_script, rendered_at=None):
         """
-        # Vue is now bundled in the client bundle, so no CDN script needed
-        is_development = frappe.conf.get('developer_mode') or frappe.conf.get('debug')
-
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>{self.context.get('title', 'Vue Page')}</title>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1">
-            <!-- Vue is bundled in the client JavaScript, no CDN needed -->
-            <style>
-                body {{
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                    margin: 0;
-                    padding: 20px;
-                    line-height: 1.6;
-                }}
-                .vue-ssr-rendered {{
-                    color: #2c3e50;
-                }}
-                .server-rendered {{
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 12px 20px;
-                    border-radius: 8px;
-                    margin-bottom: 20px;
-                    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                }}
-                .server-rendered small {{
-                    display: flex;
-                    align-items: center;
-                    gap: 8px;
-                }}
-
-                /* Vue Component Styles */
-                {styles}
-            </style>
-        </head>
-        <body>
-            <div class="server-rendered">
-                <small>
-                    🔥 Server-side rendered with Python + Node.js + Vue SSR (Self-contained Bundle)
-                    <span style="opacity: 0.8;">({frappe.utils.now()})</span>
-                </small>
-            </div>
-            <div id="app" class="vue-ssr-rendered">{rendered_html}</div>
-
-            <script>
-                // Inject server data for hydration
-                {server_data_script}
-            </script>
-
-            {self._generate_client_script_tag(client_bundle_url)}
-
-            <script>
-                console.log('🚀 Vue app hydrated with self-contained bundle!');
-            </script>
-        </body>
-        </html>
+        Build the complete HTML page (as UTF-8 bytes) with Vue SSR
+        content. rendered_at is the timestamp of the render that produced
+        this content - passing it keeps cache hits byte-identical.
         """
+        return _PAGE_TEMPLATE % {
+            b"title": str(self.context.get('title', 'Vue Page')).encode('utf-8'),
+            b"styles": styles.encode('utf-8'),
+            b"now": (rendered_at or self.request_time).encode('utf-8'),
+            b"rendered_html": rendered_html.encode('utf-8'),
+            b"server_data_script": server_data_script.encode('utf-8'),
+            b"client_script_tag": self._generate_client_script_tag(client_bundle_url).encode('utf-8'),
+        }
 
     def _fallback_html(self, html):
         """
-        Fallback HTML when Vue SSR fails
-        """
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Vue SSR Error</title>
-            <meta charset="utf-8">
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 40px; }}
-                .error {{
-                    background: #fee;
-                    border: 1px solid #f88;
-                    padding: 20px;
-                    border-radius: 4px;
-                    color: #c33;
-                }}
-                .fallback {{
-                    background: #fff3cd;
-                    border: 1px solid #ffeaa7;
-                    padding: 15px;
-                    border-radius: 4px;
-                    margin-top: 20px;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="error">
-                {html}
-            </div>
-            <div class="fallback">
-                <p><strong>Note:</strong> This is a fallback view. The Vue component could not be server-rendered.</p>
-                <p>Vue file: <code>{self.vue_file_path}</code></p>
-            </div>
-        </body>
-        </html>
+        Fallback HTML (as UTF-8 bytes) when Vue SSR fails. Every failure
+        path funnels through here, so it also flags the failure for
+        callers that must not treat this page as real output.
         """
+        self.ssr_failed = True
+        return _FALLBACK_TEMPLATE % {
+            b"html": html.encode('utf-8'),
+            b"vue_file_path": str(self.vue_file_path).encode('utf-8'),
+        }
 
     def _generate_client_script_tag(self, client_bundle_url):
         """
@@ -376,12 +623,20 @@ After installation, you may need to restart your Frappe server.
             filename = file_url.split('/')[-1]
             expected_path = os.path.join(self.app_path, 'public', 'ssr', filename)
 
-            if not os.path.exists(expected_path):
+            # Recently validated - skip the stat entirely
+            if time.monotonic() < _STATIC_OK.get(expected_path, 0):
+                return True
+
+            try:
+                os.stat(expected_path)
+            except FileNotFoundError:
+                _STATIC_OK.pop(expected_path, None)
                 logger.error(f"Vue client bundle not found at {expected_path}")
                 frappe.log_error(f"Vue client bundle not found at {expected_path}", "Vue Renderer")
                 return False
 
-            logger.debug(f"Vue client bundle found at {expected_path}")
+            _STATIC_OK[expected_path] = time.monotonic() + STATIC_REVALIDATE_SECONDS
+            logger.debug("Vue client bundle found at %s", expected_path)
             return True
 
         logger.warning(f"Unrecognized static file URL pattern: {file_url}")
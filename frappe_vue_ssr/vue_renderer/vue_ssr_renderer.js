@@ -718,53 +718,141 @@ process.on("SIGINT", () => {
   process.exit(0);
 });
 
+// Attach helper URLs and scripts for easier integration
+function finalizeResult(result) {
+  if (result.success && result.clientBundlePath) {
+    result.clientBundleUrl = renderer.getClientBundleUrl(
+      result.clientBundlePath,
+    );
+    result.serverDataScript = renderer.generateServerDataScript(
+      result.serverData,
+    );
+  }
+  return result;
+}
+
+/**
+ * Persistent worker mode (`--server`): serve render requests over
+ * stdin/stdout with 4-byte big-endian length-prefixed JSON framing.
+ * Requests look like {id, vueFile, serverData}; replies echo the id.
+ */
+function runServer() {
+  // Keep stdout clean for framing - route stray logs to stderr
+  console.log = (...args) => console.error(...args);
+
+  const writeFrame = (obj) => {
+    const payload = Buffer.from(JSON.stringify(obj), "utf-8");
+    const header = Buffer.alloc(4);
+    header.writeUInt32BE(payload.length, 0);
+    process.stdout.write(Buffer.concat([header, payload]));
+  };
+
+  const handleRequest = async (message) => {
+    try {
+      const result = await renderVueComponent(
+        message.vueFile,
+        message.serverData || {},
+      );
+      return { id: message.id, ...finalizeResult(result) };
+    } catch (error) {
+      return {
+        id: message.id,
+        success: false,
+        error: error.message,
+        html: `<div>Error: ${error.message}</div>`,
+        styles: "",
+      };
+    }
+  };
+
+  let buffer = Buffer.alloc(0);
+  let pending = Promise.resolve();
+
+  process.stdin.on("data", (chunk) => {
+    buffer = Buffer.concat([buffer, chunk]);
+
+    while (buffer.length >= 4) {
+      const frameLength = buffer.readUInt32BE(0);
+      if (buffer.length < 4 + frameLength) {
+        break;
+      }
+
+      const message = JSON.parse(
+        buffer.subarray(4, 4 + frameLength).toString("utf-8"),
+      );
+      buffer = buffer.subarray(4 + frameLength);
+
+      // Serialize request handling so replies stay in request order
+      pending = pending.then(() => handleRequest(message).then(writeFrame));
+    }
+  });
+
+  process.stdin.on("end", () => {
+    pending.then(() => process.exit(0));
+  });
+}
+
 // CLI interface
 if (import.meta.url === `file://${process.argv[1]}`) {
   const args = process.argv.slice(2);
 
-  if (args.length < 1) {
+  if (args[0] === "--server") {
+    runServer();
+  } else if (args.length < 1) {
     console.error(
-      "Usage: node vue_ssr_renderer.js <component-path> [server-data-json]",
+      "Usage: node vue_ssr_renderer.js --server | <component-path> [server-data-json]",
     );
     process.exit(1);
-  }
-
-  const componentPath = args[0];
-  const serverDataJson = args[1] || "{}";
-
-  let serverData;
-  try {
-    serverData = JSON.parse(serverDataJson);
-  } catch (e) {
-    console.error("Invalid JSON for server data:", e.message);
-    process.exit(1);
-  }
+  } else {
+    const componentPath = args[0];
+
+    // Server data arrives on stdin - argv is copied by the kernel and
+    // capped at ARG_MAX, so it's the wrong channel for large payloads.
+    // A JSON argv argument is still accepted for quick manual testing.
+    const readServerDataJson = () =>
+      new Promise((resolve) => {
+        if (args[1] !== undefined) {
+          resolve(args[1]);
+          return;
+        }
+        if (process.stdin.isTTY) {
+          resolve("{}");
+          return;
+        }
+        let data = "";
+        process.stdin.setEncoding("utf-8");
+        process.stdin.on("data", (chunk) => (data += chunk));
+        process.stdin.on("end", () => resolve(data || "{}"));
+      });
 
-  renderVueComponent(componentPath, serverData)
-    .then((result) => {
-      // Add helper URLs and scripts for easier integration
-      if (result.success && result.clientBundlePath) {
-        result.clientBundleUrl = renderer.getClientBundleUrl(
-          result.clientBundlePath,
-        );
-        result.serverDataScript = renderer.generateServerDataScript(
-          result.serverData,
+    readServerDataJson()
+      .then((serverDataJson) => {
+        let serverData;
+        try {
+          serverData = JSON.parse(serverDataJson);
+        } catch (e) {
+          console.error("Invalid JSON for server data:", e.message);
+          process.exit(1);
+        }
+        return renderVueComponent(componentPath, serverData);
+      })
+      .then((result) => {
+        // Raw single-line JSON - callers parse it, nobody reads it
+        console.log(JSON.stringify(finalizeResult(result)));
+      })
+      .catch((error) => {
+        console.error(
+          JSON.stringify({
+            success: false,
+            error: error.message,
+            html: `<div>Error: ${error.message}</div>`,
+            styles: "",
+            clientJS: "",
+          }),
         );
-      }
-      console.log(JSON.stringify(result, null, 2));
-    })
-    .catch((error) => {
-      console.error(
-        JSON.stringify({
-          success: false,
-          error: error.message,
-          html: `<div>Error: ${error.message}</div>`,
-          styles: "",
-          clientJS: "",
-        }),
-      );
-      process.exit(1);
-    });
+        process.exit(1);
+      });
+  }
 }
 
 export { renderVueComponent, VueSSRRenderer };